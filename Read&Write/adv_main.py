@@ -1,14 +1,19 @@
 import os
 import time
 import shutil
-import multiprocessing
 import statistics
 import threading
 from queue import Queue, Empty
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import asyncio  # For async operations
-import aiofiles  # For async file operations
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional — task5 falls back to list.sort
+    pa = None
 
 def clean_companies_file(input_file, clean_file):
     """
@@ -27,9 +32,12 @@ def clean_companies_file(input_file, clean_file):
 def task1_sequential_write(clean_file, output_file):
     start_time = time.perf_counter()
     
-    with open(clean_file, 'r') as infile, open(output_file, 'w') as outfile:
-        for line in infile:
-            outfile.write(line.strip() + '\n')
+    # Binary mode: the transform is whitespace-only, so decoding UTF-8 to
+    # str and re-encoding on write is pure overhead.
+    with open(clean_file, 'rb') as infile:
+        data = infile.read()
+    with open(output_file, 'wb') as outfile:
+        outfile.write(b'\n'.join(line.strip() for line in data.splitlines()) + b'\n')
     
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
@@ -37,10 +45,10 @@ def task1_sequential_write(clean_file, output_file):
 def task2_batch_write(clean_file, output_file, batch_size=1000):
     start_time = time.perf_counter()
     
-    with open(clean_file, 'r') as infile, open(output_file, 'w') as outfile:
+    with open(clean_file, 'rb') as infile, open(output_file, 'wb') as outfile:
         batch = []
         for line in infile:
-            batch.append(line.strip() + '\n')
+            batch.append(line.strip() + b'\n')
             if len(batch) >= batch_size:
                 outfile.writelines(batch)
                 batch = []
@@ -60,11 +68,14 @@ def task3_parallel_sequential_write(clean_file, output_file):
     with open(clean_file, 'r') as f:
         lines = f.readlines()
     
-    num_processes = min(multiprocessing.cpu_count(), len(lines))
-    chunk_size = len(lines) // num_processes
+    # Threads, not processes: the per-line work is a tiny string edit, so
+    # process startup and pickling would dwarf it. The GIL is released
+    # around the file I/O, which is where the time actually goes.
+    num_workers = min(32, len(lines))
+    chunk_size = max(1, len(lines) // num_workers)
     chunks = [lines[i:i+chunk_size] for i in range(0, len(lines), chunk_size)]
     
-    with ProcessPoolExecutor(max_workers=num_processes) as executor:
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
         processed_chunks = list(executor.map(process_chunk, chunks))
     
     with open(output_file, 'w') as outfile:
@@ -76,36 +87,59 @@ def task3_parallel_sequential_write(clean_file, output_file):
 
 def task4_fastest_write(clean_file, output_file):
     start_time = time.perf_counter()
-    shutil.copy2(clean_file, output_file)
+
+    # Zero-copy kernel-space transfer — the practical floor for a file copy.
+    # shutil.copyfile covers platforms without sendfile (e.g. Windows).
+    if hasattr(os, 'sendfile'):
+        with open(clean_file, 'rb') as src, open(output_file, 'wb') as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+    else:
+        shutil.copyfile(clean_file, output_file)
+
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
 
 def task5_sort_write(clean_file, output_file):
     start_time = time.perf_counter()
     
-    with open(clean_file, 'r') as infile:
-        lines = infile.readlines()
-        lines.sort()  # Sort the lines alphabetically
-    
-    with open(output_file, 'w') as outfile:
-        outfile.writelines(lines)
+    with open(clean_file, 'rb') as infile:
+        lines = infile.read().splitlines()
+
+    if pa is not None:
+        # Arrow sorts in a C loop over string pointers, skipping the
+        # object-protocol comparison dispatch list.sort pays per pair
+        arr = pa.array(lines)
+        lines = arr.take(pc.sort_indices(arr)).to_pylist()
+    else:
+        # Timsort over bytes compares with memcmp — cheaper than str comparison
+        lines.sort()
+
+    with open(output_file, 'wb') as outfile:
+        outfile.write(b'\n'.join(lines) + b'\n')
     
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
 
 async def task6_async_write(clean_file, output_file):
     """
-    Asynchronous file writing using aiofiles
+    Asynchronous file writing using asyncio.to_thread around stdlib I/O
     """
     start_time = time.perf_counter()
     
-    async with aiofiles.open(clean_file, 'r') as infile:
-        content = await infile.read()
-        lines = content.splitlines()
+    # aiofiles routes every call through a thread pool anyway, so wrapping
+    # plain stdlib I/O in asyncio.to_thread does the same job with fewer
+    # per-call round-trips.
+    content = await asyncio.to_thread(Path(clean_file).read_text)
+    lines = content.splitlines()
     
-    async with aiofiles.open(output_file, 'w') as outfile:
-        for line in lines:
-            await outfile.write(line + '\n')
+    await asyncio.to_thread(Path(output_file).write_text, '\n'.join(lines) + '\n')
     
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
@@ -124,94 +158,104 @@ def task7_threaded_queue_write(clean_file, output_file, num_threads=4):
     line_queue = Queue()
     for line in lines:
         line_queue.put(line.strip())
-    
-    # Create a lock for file writing
+
+    # Open the output once with a large buffer and share it between workers;
+    # the old per-line open/close in append mode paid a syscall pair and a
+    # lock round-trip for every single line.
     file_lock = threading.Lock()
-    
-    def worker():
-        while True:
-            try:
-                # Check if queue is empty
-                if line_queue.empty():
+
+    with open(output_file, 'w', buffering=1 << 20) as outfile:
+        def worker():
+            while True:
+                # Drain a batch of lines without holding the lock, then
+                # write the whole batch under one lock acquisition.
+                batch = []
+                try:
+                    while len(batch) < 1024:
+                        batch.append(line_queue.get(timeout=0.01) + '\n')
+                except Empty:
+                    pass
+
+                if not batch:
                     break
-                    
-                line = line_queue.get()
+
                 with file_lock:
-                    with open(output_file, 'a') as outfile:
-                        outfile.write(line + '\n')
-                line_queue.task_done()
-            except Exception as e:
-                print(f"Error in worker thread: {e}")
-                break
-    
-    # Create and start threads
-    threads = []
-    for _ in range(num_threads):
-        t = threading.Thread(target=worker)
-        t.start()
-        threads.append(t)
-    
-    # Wait for all threads to complete
-    for t in threads:
-        t.join()
-    
+                    outfile.writelines(batch)
+                for _ in batch:
+                    line_queue.task_done()
+
+        # Create and start threads
+        threads = []
+        for _ in range(num_threads):
+            t = threading.Thread(target=worker)
+            t.start()
+            threads.append(t)
+
+        # Wait for all threads to complete
+        for t in threads:
+            t.join()
+
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
 
 def task8_thread_pool_write(clean_file, output_file):
     """
-    Using ThreadPoolExecutor for parallel writing
+    Using ThreadPoolExecutor for parallel processing with a single writer
     """
     start_time = time.perf_counter()
-    
+
     with open(clean_file, 'r') as infile:
         lines = infile.readlines()
-    
-    def write_chunk(chunk):
-        with open(output_file, 'a') as outfile:
-            for line in chunk:
-                outfile.write(line.strip() + '\n')
-    
+
+    # Workers only transform their chunk into a byte blob; concurrent
+    # appenders to the same file just serialize on the file offset in the
+    # kernel and can interleave chunks out of order.
+    def process_chunk(chunk):
+        return ''.join(line.strip() + '\n' for line in chunk).encode()
+
     # Split lines into chunks
-    num_threads = min(threading.active_count() * 2, len(lines))
-    chunk_size = max(1, len(lines) // num_threads)
+    chunk_size = max(1, len(lines) // 8)
     chunks = [lines[i:i+chunk_size] for i in range(0, len(lines), chunk_size)]
-    
+    num_threads = min(8, len(chunks))
+
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        executor.map(write_chunk, chunks)
-    
+        results = list(executor.map(process_chunk, chunks))
+
+    # Single writer keeps the output ordered and the write path contention-free
+    with open(output_file, 'wb') as outfile:
+        outfile.writelines(results)
+
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
 
 def task9_mixed_pool_write(clean_file, output_file):
     """
-    Combining both process and thread pools for hybrid parallelism
+    Combining separate processing and writing thread pools
     """
     start_time = time.perf_counter()
     
     with open(clean_file, 'r') as infile:
         lines = infile.readlines()
     
-    # Move process_chunk outside to make it picklable
-    num_processes = multiprocessing.cpu_count()
-    chunk_size = max(1, len(lines) // num_processes)
+    # Threads instead of processes for the transform stage — str.strip on
+    # already-read lines is I/O-bound territory where worker processes
+    # only add startup and pickling cost.
+    num_workers = min(32, len(lines))
+    chunk_size = max(1, len(lines) // num_workers)
     chunks = [lines[i:i+chunk_size] for i in range(0, len(lines), chunk_size)]
     
-    # Process data in parallel
-    with ProcessPoolExecutor(max_workers=num_processes) as process_executor:
-        processed_chunks = []
-        for chunk in chunks:
-            processed_chunk = [line.strip() + '\n' for line in chunk]
-            processed_chunks.append(processed_chunk)
+    # Process data in parallel — the old loop ran the comprehension inline
+    # in the main thread and never handed any work to the pool
+    with ThreadPoolExecutor(max_workers=num_workers) as process_executor:
+        processed_chunks = list(process_executor.map(process_chunk, chunks))
     
-    # Write processed chunks using threads
-    def write_chunk(processed_chunk):
-        with open(output_file, 'a') as outfile:
+    # Single ordered writer, same as task8 — concurrent appenders serialize
+    # on the file offset anyway, interleave chunks out of order, and the
+    # append mode made the output grow across runs instead of replacing it
+    with open(output_file, 'w') as outfile:
+        for processed_chunk in processed_chunks:
             outfile.writelines(processed_chunk)
     
-    with ThreadPoolExecutor(max_workers=num_processes*2) as thread_executor:
-        thread_executor.map(write_chunk, processed_chunks)
-    
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
 
@@ -221,26 +265,33 @@ async def task10_chunked_async_write(clean_file, output_file, chunk_size=1000):
     """
     start_time = time.perf_counter()
     
-    async def write_chunk(chunk, semaphore):
-        async with semaphore:
-            async with aiofiles.open(output_file, 'a') as outfile:
-                for line in chunk:
-                    await outfile.write(line.strip() + '\n')
-    
     # Read all lines
-    async with aiofiles.open(clean_file, 'r') as infile:
-        content = await infile.read()
-        lines = content.splitlines()
+    content = await asyncio.to_thread(Path(clean_file).read_text)
+    lines = content.splitlines()
     
     # Split into chunks
     chunks = [lines[i:i+chunk_size] for i in range(0, len(lines), chunk_size)]
     
     # Create semaphore to limit concurrent file operations
     semaphore = asyncio.Semaphore(5)
+    write_lock = threading.Lock()
     
-    # Create tasks for each chunk
-    tasks = [write_chunk(chunk, semaphore) for chunk in chunks]
-    await asyncio.gather(*tasks)
+    # One shared handle; chunk writes run in worker threads under a lock
+    with open(output_file, 'w', buffering=1 << 20) as outfile:
+        async def write_chunk(chunk, semaphore):
+            # Serialize the chunk off the event loop, single write per chunk
+            buf = '\n'.join(line.strip() for line in chunk) + '\n'
+
+            def locked_write():
+                with write_lock:
+                    outfile.write(buf)
+
+            async with semaphore:
+                await asyncio.to_thread(locked_write)
+        
+        # Create tasks for each chunk
+        tasks = [write_chunk(chunk, semaphore) for chunk in chunks]
+        await asyncio.gather(*tasks)
     
     end_time = time.perf_counter()
     return max(end_time - start_time, 0.000001)
@@ -280,28 +331,31 @@ def visualize_performance(task_names, times, performance_ratios):
     if len(task_names) != len(times):
         task_names = [f"Task {i+1}" for i in range(len(times))]  # Generate task names dynamically
     
+    # Cheap AGG settings: simplify paths and batch them through the renderer
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['agg.path.chunksize'] = 10000
+
     plt.figure(figsize=(12, 6))
     
     # Execution times comparison
-    plt.subplot(1, 2, 1)
-    plt.bar(task_names, times, color='skyblue')
-    plt.title('Execution Times Comparison')
-    plt.ylabel('Time (seconds)')
+    ax1 = plt.subplot(1, 2, 1)
+    bars1 = ax1.bar(task_names, times, color='skyblue')
+    ax1.set_title('Execution Times Comparison')
+    ax1.set_ylabel('Time (seconds)')
     plt.xticks(rotation=45, ha='right')
-    for i, time_val in enumerate(times):
-        plt.text(i, time_val, f'{time_val:.6f}', ha='center', va='bottom', fontsize=9)
+    ax1.bar_label(bars1, fmt='%.6f', padding=3, fontsize=9)
     
     # Relative performance speedup
-    plt.subplot(1, 2, 2)
-    plt.bar(task_names, performance_ratios, color='lightgreen')
-    plt.title('Relative Performance Speedup')
-    plt.ylabel('Speedup Ratio')
+    ax2 = plt.subplot(1, 2, 2)
+    bars2 = ax2.bar(task_names, performance_ratios, color='lightgreen')
+    ax2.set_title('Relative Performance Speedup')
+    ax2.set_ylabel('Speedup Ratio')
     plt.xticks(rotation=45, ha='right')
-    for i, ratio in enumerate(performance_ratios):
-        plt.text(i, ratio, f'{ratio:.2f}x', ha='center', va='bottom', fontsize=9)
+    ax2.bar_label(bars2, fmt='%.2fx', padding=3, fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig('performance_analysis.png')
+    # tight_layout would re-render the whole figure; for a fixed two-panel
+    # chart the default layout is fine
+    plt.savefig('performance_analysis.png', dpi=100)
     plt.close()
 
 